@@ -0,0 +1,55 @@
+"""Binomial kernels backing `Game`'s odds tables."""
+from functools import lru_cache
+from math import exp, lgamma, log, log1p
+
+import numpy as np
+from numba import float64, int64, njit
+from scipy.special import betainc
+
+
+@njit(float64[:, :](int64, float64), cache=True)
+def pmf_table(max_n: int, p: float) -> np.ndarray:
+    """Odds of exactly q successes (rows) in n trials (columns) for every q and n up to `max_n`."""
+    # Work in log-space so large n can't overflow the coefficient or underflow the powers,
+    # and so the binomial coefficient can come from `lgamma`, which Numba supports.
+    # Every entry shares these, so each one is only computed once.
+    log_factorial = np.empty(max_n + 1)
+    for k in range(max_n + 1):
+        log_factorial[k] = lgamma(k + 1)
+    log_hit = log(p) if p > 0 else -np.inf
+    log_miss = log1p(-p) if p < 1 else -np.inf
+
+    table = np.zeros((max_n + 1, max_n + 1))
+    for n in range(max_n + 1):
+        for q in range(n + 1):
+            # Skip zero-count terms outright; 0 * -inf would be NaN when p is 0 or 1.
+            log_odds = log_factorial[n] - log_factorial[q] - log_factorial[n - q]
+            if q:
+                log_odds += q * log_hit
+            if n - q:
+                log_odds += (n - q) * log_miss
+            table[q, n] = exp(log_odds)
+    return table
+
+
+def sf_table(max_n: int, p: float) -> np.ndarray:
+    """Odds of at least q successes (rows) in n trials (columns) for every q and n up to `max_n`.
+
+    Each entry is the closed form `I_p(q, n - q + 1)`, the regularized incomplete beta function,
+    rather than a sum over the tail of the PMF."""
+    q, n = np.ogrid[:max_n + 1, :max_n + 1]
+    # The identity only holds for 1 <= q <= n, so clamp the arguments and patch the edges after.
+    tail = betainc(np.maximum(q, 1), np.maximum(n - q + 1, 1), p)
+    return np.where(q == 0, 1.0, np.where(q > n, 0.0, tail))
+
+
+@lru_cache(maxsize=32)
+def odds_tables(max_n: int, dice_size: int) -> tuple[np.ndarray, np.ndarray]:
+    """The `pmf_table` and `sf_table` for rolling `dice_size`-sided dice, shared between games.
+
+    The tables are read-only, since every caller with the same arguments gets the same arrays."""
+    p = 1 / dice_size
+    tables = (pmf_table(max_n, p), sf_table(max_n, p))
+    for table in tables:
+        table.flags.writeable = False
+    return tables
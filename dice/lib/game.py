@@ -1,85 +1,95 @@
-from scipy.special import binom
+import numpy as np
 
+from collections import deque
 from dataclasses import dataclass
-from functools import total_ordering
-from random import randint
 
-_pid = 0
+from . import _odds
+
+_rng = np.random.default_rng()
+
+def _dice_dtype(dice_size: int) -> np.dtype:
+    """The smallest integer type that can hold every face of a `dice_size`-sided die."""
+    return np.min_scalar_type(dice_size)
 
 class GameError(Exception):
     pass
 
 
-@total_ordering
-@dataclass
+# A bet is less than another bet by checking the amount first, then the face value,
+# which is the order the fields are declared in.
+@dataclass(frozen=True, slots=True, order=True)
 class Bet:
     amount: int
     face: int
 
-    # A bet is less than another bet by checking the amount first, then the face value.
-    def __lt__(self, other: "Bet"):
-        if other is None:
-            return other
-        return (self.amount, self.face) < (other.amount, other.face)
-
     def __str__(self) -> str:
         return f"{self.amount}x [{self.face}]"
 
 
 class Player:
-    """Represents one individual player."""
-    def __init__(self, name: str, dice_count = 5, dice_size = 6):
-        global _pid
-        self.id = _pid
-        _pid += 1
+    """Represents one individual player. `pid` is the player's ID, which is only unique within its `Game`."""
+    def __init__(self, name: str, dice_count = 5, dice_size = 6, slots: np.ndarray | None = None, *, pid: int):
+        self.id = pid
         self.name = name
         self.dice_size = dice_size
 
-        # Dice don't need to be special, a list of numbers is probably fine
-        self.dice: list[int] = []
-        for i in range(dice_count):
-            self.dice.append(randint(1, self.dice_size))
+        # Dice don't need to be special, an array of small numbers is plenty.
+        # `slots` lets a Game hand out a slice of its shared buffer; lost dice are zeroed out.
+        self._slots: np.ndarray = np.zeros(dice_count, dtype=_dice_dtype(dice_size)) if slots is None else slots
+        self._len = dice_count
+        self.dice: np.ndarray = self._slots[:self._len]
+        self.roll()
 
     def roll(self):
-        count = len(self.dice)
-        self.dice.clear()
-        for i in range(count):
-            self.dice.append(randint(1, self.dice_size))
+        self.dice[:] = _rng.integers(1, self.dice_size + 1, size=self._len, dtype=self._slots.dtype)
 
     def remove_die(self):
-        self.dice.pop()
+        self._len -= 1
+        self._slots[self._len] = 0
+        self.dice = self._slots[:self._len]
 
     # A Player loses when they run out of dice.
     @property
     def lost(self) -> bool:
-        return len(self.dice) == 0
+        return self._len == 0
 
     @property
     def dice_string(self) -> str:
-        s = ""
-        for i in self.dice:
-            s += f" [{i}]"
-        return s.strip()
+        return " ".join(f"[{i}]" for i in self.dice)
 
     def __str__(self) -> str:
-        s = f"{self.name:>10}: "
-        for i in self.dice:
-            s += f" [{i}]"
-        return s
+        return f"{self.name:>10}:  {self.dice_string}"
 
 
 class Game:
     """Represents an entire game's backend logic and state-keeping."""
-    def __init__(self, player_names: list[str] = [], dice_count = 5, dice_size = 6):
+    def __init__(self, player_names: list[str] | None = None, dice_count = 5, dice_size = 6):
+        if player_names is None:
+            player_names = ()
         self.dice_count = dice_count
         self.dice_size = dice_size
 
-        # Create players from names
-        self.players: list[Player] = []
+        # Every die on the table lives in one buffer, each player owning a slice of it
+        self._dice_buf = np.zeros(len(player_names) * self.dice_count, dtype=_dice_dtype(self.dice_size))
+
+        # Create players from names, numbering them per-game
+        self._next_pid = 0
+        self.players: deque[Player] = deque()
         for name in player_names:
+            slots = self._dice_buf[self._next_pid * self.dice_count:(self._next_pid + 1) * self.dice_count]
             self.players.append(
-                Player(name, self.dice_count, self.dice_size)
+                Player(name, self.dice_count, self.dice_size, slots, pid = self._next_pid)
             )
+            self._next_pid += 1
+
+        # Odds only depend on (q, n), and n never grows past the starting dice count,
+        # so every in-game query can be answered from tables built once here.
+        # Queries for a larger n (see `_odds_tables_for()`) grow the tables instead.
+        self._build_odds_tables(len(self.players) * self.dice_count)
+
+        # How many of each face are on the table, indexed by face.
+        self._face_counts: np.ndarray = None
+        self._count_faces()
 
         # Game state
         self.current_bet: Bet = None
@@ -89,49 +99,70 @@ class Game:
     @property
     def dice_in_play(self) -> int:
         """Amount of dice in play."""
-        return sum((len(p.dice) for p in self.players))
+        return int(np.count_nonzero(self._dice_buf))
 
     @property
-    def all_dice(self) -> list[int]:
+    def all_dice(self) -> np.ndarray:
         """Every individual die in play."""
-        d = []
-        for p in self.players:
-            d += p.dice
-        return d
+        return self._dice_buf[self._dice_buf != 0]
 
     @property
     def game_over(self) -> bool:
         """Return True if only one player is left."""
         return len(self.players) == 1
 
+    def _count_faces(self):
+        """Recount every face on the table. Dice only change on a roll, so this is called from `setup()` and `reset()`."""
+        # Counting the whole buffer avoids a copy; removed dice only ever land in face 0.
+        self._face_counts = np.bincount(self._dice_buf, minlength=self.dice_size + 1)
+
     def check_bet(self, bet: Bet) -> bool:
         """Return True if a bet is valid against the current dice in play."""
-        return self.all_dice.count(bet.face) >= bet.amount
+        return bool(self._face_counts[bet.face] >= bet.amount)
 
     def check_spot_on(self, bet: Bet) -> bool:
         """Return True if a bet is spot-on against the current dice in play."""
-        return self.all_dice.count(bet.face) == bet.amount
+        return bool(self._face_counts[bet.face] == bet.amount)
+
+    def _build_odds_tables(self, max_dice: int):
+        """Tabulate P(X = q) and P(X >= q) for every q (rows) and n (columns) up to `max_dice`."""
+        self._pmf_table, self._sf_table = _odds.odds_tables(max_dice, self.dice_size)
+
+    def _odds_tables_for(self, n: int) -> tuple[np.ndarray, np.ndarray]:
+        """The PMF and tail tables, rebuilt first if they don't reach `n` dice."""
+        if n >= self._pmf_table.shape[1]:
+            self._build_odds_tables(n)
+        return self._pmf_table, self._sf_table
 
-    def spot_on_equation(self, die_face: int, dice_amount: int, dice_in_play: int, known_dice: list[int] = []) -> float:
+    def spot_on_equation(self, die_face: int, dice_amount: int, dice_in_play: int, known_dice: list[int] | np.ndarray | None = None) -> float:
         """What are the odds of a spot-on bet being true?"""
-        dice_amount -= known_dice.count(die_face)
-        dice_in_play -= len(known_dice)
-        q = dice_amount
-        n = dice_in_play
-        c = binom(n, q)
-        return c * ((1/self.dice_size)**q) * (((self.dice_size - 1)/self.dice_size)**(n - q))
-
-    def bet_equation(self, die_face: int, dice_amount: int, dice_in_play: int, known_dice: list[int] = []) -> float:
+        if known_dice is None:
+            known_dice = ()
+        q = dice_amount - np.count_nonzero(np.asarray(known_dice) == die_face)
+        n = dice_in_play - len(known_dice)
+        if not 0 <= q <= n:
+            return 0.0
+        pmf_table, _ = self._odds_tables_for(n)
+        return float(pmf_table[q, n])
+
+    def bet_equation(self, die_face: int, dice_amount: int, dice_in_play: int, known_dice: list[int] | np.ndarray | None = None) -> float:
         """What are the odds of a bet being true?"""
-        dice_amount -= known_dice.count(die_face)
-        dice_in_play -= len(known_dice)
-        return sum([self.spot_on_equation(die_face, i, dice_in_play) for i in range(dice_amount, dice_in_play + 1)])
+        if known_dice is None:
+            known_dice = ()
+        q = dice_amount - np.count_nonzero(np.asarray(known_dice) == die_face)
+        n = dice_in_play - len(known_dice)
+        if q <= 0:
+            return 1.0
+        if q > n:
+            return 0.0
+        _, sf_table = self._odds_tables_for(n)
+        return float(sf_table[q, n])
 
     def next_player(self) -> Player:
-        """Take a player off the beginning of the list,
+        """Take a player off the beginning of the queue,
            and return it after putting it back on the end."""
         self.previous_player = self.current_player
-        p = self.players.pop(0)
+        p = self.players.popleft()
         self.players.append(p)
         self.current_player = p
         return p
@@ -150,6 +181,7 @@ class Game:
         self.current_player = None
         self.previous_player = None
         self.current_bet = None
+        self._count_faces()
         self.next_player()
 
     def reset(self):
@@ -157,6 +189,7 @@ class Game:
         for player in self.players:
             player.roll()
         self.current_bet = None
+        self._count_faces()
 
     # First bet works slightly differently to other bets so it's its own thing.
     def first_bet(self, bet: Bet):
@@ -171,8 +204,7 @@ class Game:
             raise GameError(f"Bet is for more dice than are on the table. ({bet.amount}).")
         if bet.face > self.dice_size or 1 > bet.face:
             raise GameError(f"Bet is for an invalid die face ({bet.face}).")
-        if bet.amount > self.current_bet.amount or (bet.amount == self.current_bet.amount
-                                                    and bet.face > self.current_bet.face):
+        if bet > self.current_bet:
             self.current_bet = bet
         else:
             raise GameError("Bet ({bet}) isn't better than the current bet ({self.current_bet})")
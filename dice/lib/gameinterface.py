@@ -1,5 +1,9 @@
+from dataclasses import dataclass
+
 from rich.console import Console
+from rich.style import Style
 from rich.table import Table
+from rich.text import Text
 
 from .game import Bet, Game, Player
 
@@ -15,6 +19,22 @@ ascii_art = R"""
                                                                                     
                                                                                     """
 
+# Static screens, parsed once rather than on every print.
+_ASCII_ART = Text(ascii_art, style="green")
+_OPTIONS_HEADER = Text.from_markup("[u]Options:[/u]\n[b](1)[/b] Call a higher bet.")
+_OPTIONS_FOOTER = Text.from_markup("[b](3)[/b] Declare the current bet spot-on.\n")
+
+colors = ("red", "green", "blue", "yellow", "magenta", "cyan", "orange1", "purple", "orange4", "grey50")
+_color_styles = {color: Style.parse(color) for color in colors}
+
+
+@dataclass(frozen=True, slots=True)
+class _PlayerLook:
+    """How a player is drawn: their color as a `Style` for table rows, and their name as markup."""
+    style: Style
+    markup: str
+
+
 def pause():
     """Alias for `input()`, which just waits for a keypress and throws away the result."""
     input()
@@ -30,18 +50,21 @@ class GameInterface:
         self.console = Console()
         self.game_over = False
 
+        # A player's color never changes, so their look is worked out once by `setup()`.
+        self._looks: dict[int, _PlayerLook] = {}
+
+    def _add_player_rows(self, table: Table):
+        """Add a row with each player's formatted dice to a table."""
+        for player in self.game.players:
+            table.add_row(player.name, self.fd(player.dice_string), style = self._looks[player.id].style)
+
     def print(self):
         """Print a debug of the current game state."""
-        table = Table()
-        table.title = f"Liar's Dice | Turn {self.turn_count}"
-        table.show_header = False
-        table.show_lines = True
-        table.title_justify = "center"
-        table.title_style = "italic"
+        table = Table(title = f"Liar's Dice | Turn {self.turn_count}", show_header = False, show_lines = True,
+                      title_justify = "center", title_style = "italic")
         table.add_row("Current Player", self.game.current_player.name)
-        table.add_row("Current Bet", self.game.current_bet)
-        for player in self.game.players:
-            table.add_row(player.name, self.fd(player.dice_string), style = self.color_from_player(player))
+        table.add_row("Current Bet", str(self.game.current_bet or ""))
+        self._add_player_rows(table)
         self.console.print(table)
 
     def fd(self, s: str) -> str:
@@ -52,34 +75,28 @@ class GameInterface:
 
     def print_all_dice(self):
         """Print all players dice, formatted."""
-        table = Table()
-        table.show_header = False
-        table.show_lines = True
-        for player in self.game.players:
-            table.add_row(player.name, self.fd(player.dice_string), style = self.color_from_player(player))
+        table = Table(show_header = False, show_lines = True)
+        self._add_player_rows(table)
         self.console.print(table)
 
     def setup(self, dice_count = 5, dice_size = 6, unicode_dice = False, show_odds = False):
         """Prepare a new game."""
         self.console.clear()
-        self.console.print(ascii_art, style="green")
+        self.console.print(_ASCII_ART)
         namestring = input("Enter names seperated by spaces. >")
         names = namestring.split()
         self.game = Game(names, dice_count, dice_size)
         self.game.setup()
+        for p in self.game.players:
+            color = colors[p.id % len(colors)]
+            self._looks[p.id] = _PlayerLook(_color_styles[color], f"[{color}]{p.name}[/{color}]")
         self.unicode_dice = unicode_dice
         self.show_odds = show_odds
         self.turn_count = 0
 
-    def color_from_player(self, p: Player) -> str:
-        """Take a Player and return a color based on their ID."""
-        colors = ["red", "green", "blue", "yellow", "magenta", "cyan", "orange1", "purple", "brown", "gray"]
-        return colors[p.id % len(colors)]
-
     def formatted_name(self, p: Player) -> str:
         """Return the player's name formatted with their color."""
-        color = self.color_from_player(p)
-        return f"[{color}]{p.name}[/{color}]"
+        return self._looks[p.id].markup
 
     @property
     def current_player_name(self) -> str:
@@ -162,10 +179,8 @@ class GameInterface:
             self.print()
         self.console.print(self.fd(f"Your Dice: {self.game.current_player.dice_string}"))
         self.console.print(self.fd(f"Current Bet: {self.game.current_bet}\n"))
-        self.console.print(f"[u]Options:[/u]\n"
-                           f"[b](1)[/b] Call a higher bet.\n"
-                           f"[b](2)[/b] Call {self.previous_player_name}'s bluff.\n"
-                           f"[b](3)[/b] Declare the current bet spot-on.\n")
+        bluff_option = Text.from_markup(f"[b](2)[/b] Call {self.previous_player_name}'s bluff.")
+        self.console.print(Text("\n").join([_OPTIONS_HEADER, bluff_option, _OPTIONS_FOOTER]))
         option = None
         while option is None:
             opt = input("> ")
@@ -1,37 +1,34 @@
+import argparse
 import os
-import sys
 
 from dice.lib.gameinterface import GameInterface
 
 
+def positive_int(value: str) -> int:
+    """An `argparse` type for counts that have to be at least 1."""
+    try:
+        n = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"{value!r} is not a whole number")
+    if n < 1:
+        raise argparse.ArgumentTypeError(f"{n} is not at least 1")
+    return n
+
+
 def main():
     os.system("")
     # check passed in arguments
-    dc = 5
-    ds = 6
-    u = False
-    so = True
-    debug = False
-    for arg in sys.argv[1:]:
-        # dice count
-        if arg.startswith("c="):
-            dc = int(arg[2:])
-        # dice size
-        if arg.startswith("d="):
-            ds = int(arg[2:])
-        # no unicode
-        if arg == "-u":
-            u = True
-        # debug
-        if arg == "-d":
-            debug = True
-        # show odds
-        if arg == "-no":
-            so = False
+    parser = argparse.ArgumentParser(prog="dice", description="Play Liar's Dice in the terminal.")
+    parser.add_argument("-c", "--dice-count", type=positive_int, default=5, help="dice each player starts with")
+    parser.add_argument("-s", "--dice-size", type=positive_int, default=6, help="number of faces on each die")
+    parser.add_argument("-u", "--unicode", action="store_true", help="draw d6s as unicode dice")
+    parser.add_argument("-d", "--debug", action="store_true", help="show the full game state each turn")
+    parser.add_argument("-no", "--no-odds", action="store_false", dest="show_odds", help="don't show the odds after a call")
+    args = parser.parse_args()
 
     # Create a game and an interface
-    game_interface = GameInterface(debug)
-    game_interface.setup(dc, ds, u, so)
+    game_interface = GameInterface(args.debug)
+    game_interface.setup(args.dice_count, args.dice_size, args.unicode, args.show_odds)
     game_interface.print()
 
     while not game_interface.game_over:
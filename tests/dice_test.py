@@ -1,2 +1,102 @@
-def test_dice():
-    assert False
+from dataclasses import FrozenInstanceError
+
+import numpy as np
+import pytest
+from scipy.stats import binom
+
+from dice.lib.game import Bet, Game
+
+
+@pytest.mark.parametrize("dice_size", [1, 2, 6, 20])
+def test_odds_match_binomial(dice_size):
+    game = Game(["a", "b", "c", "d"], 5, dice_size)
+    p = 1 / dice_size
+    for n in range(game.dice_in_play + 1):
+        # q runs past both ends: q <= 0 is a sure bet, q > n is impossible.
+        for q in range(-2, n + 3):
+            assert game.spot_on_equation(1, q, n) == pytest.approx(binom.pmf(q, n, p), abs=1e-12)
+            assert game.bet_equation(1, q, n) == pytest.approx(binom.sf(q - 1, n, p), abs=1e-12)
+
+
+def test_odds_edges():
+    game = Game(["a", "b"], 5, 6)
+    assert game.bet_equation(3, 0, 10) == 1.0
+    assert game.bet_equation(3, -1, 10) == 1.0
+    assert game.bet_equation(3, 11, 10) == 0.0
+    assert game.spot_on_equation(3, -1, 10) == 0.0
+    assert game.spot_on_equation(3, 11, 10) == 0.0
+
+
+def test_odds_discount_known_dice():
+    game = Game(["a", "b"], 5, 6)
+    known = np.array([3, 3, 1, 5, 6])
+    # Two 3s are already in hand, so the other 5 dice need to show 2 more.
+    assert game.bet_equation(3, 4, 10, known) == pytest.approx(binom.sf(1, 5, 1 / 6))
+    assert game.spot_on_equation(3, 4, 10, known) == pytest.approx(binom.pmf(2, 5, 1 / 6))
+    assert game.bet_equation(3, 4, 10, [3, 3, 1, 5, 6]) == game.bet_equation(3, 4, 10, known)
+
+
+def test_odds_past_starting_dice():
+    # Odds can be asked for more dice than the game started with.
+    game = Game(["a", "b"], 5, 6)
+    assert game.bet_equation(3, 2, 11) == pytest.approx(binom.sf(1, 11, 1 / 6))
+    assert game.spot_on_equation(3, 2, 40) == pytest.approx(binom.pmf(2, 40, 1 / 6))
+    assert Game().bet_equation(1, 2, 10) == pytest.approx(binom.sf(1, 10, 1 / 6))
+
+def test_check_bet_matches_count():
+    game = Game(["a", "b", "c"], 5, 6)
+    game.setup()
+    for _ in range(50):
+        game.reset()
+        dice = np.concatenate([p.dice for p in game.players])
+        for face in range(1, 7):
+            count = int(np.count_nonzero(dice == face))
+            for amount in range(1, 16):
+                assert game.check_bet(Bet(amount, face)) == (count >= amount)
+                assert game.check_spot_on(Bet(amount, face)) == (count == amount)
+
+
+def test_removed_dice_leave_the_table():
+    game = Game(["a", "b", "c"], 3, 6)
+    game.setup()
+    a, b, c = sorted(game.players, key=lambda p: p.name)
+    a.remove_die()
+    for _ in range(3):
+        b.remove_die()
+    assert b.lost
+    assert game.remove_lost_players() == [b]
+    game.reset()
+
+    dice = np.concatenate([p.dice for p in game.players])
+    assert len(a.dice) == 2 and len(b.dice) == 0 and len(c.dice) == 3
+    # Neither the lost dice nor the eliminated player's count towards the table.
+    assert game.dice_in_play == len(dice) == 5
+    assert len(game.all_dice) == 5
+    assert sorted(game.all_dice) == sorted(dice)
+    for face in range(1, 7):
+        count = int(np.count_nonzero(dice == face))
+        assert game.check_bet(Bet(count, face))
+        assert not game.check_bet(Bet(count + 1, face))
+        assert game.check_spot_on(Bet(count, face))
+
+
+def test_player_ids_restart_per_game():
+    first = Game(["a", "b", "c"])
+    second = Game(["d", "e"])
+    assert [p.id for p in first.players] == [0, 1, 2]
+    assert [p.id for p in second.players] == [0, 1]
+
+
+def test_bet_ordering():
+    # Amount is compared first, then face.
+    assert Bet(2, 1) > Bet(1, 6)
+    assert Bet(2, 4) > Bet(2, 3)
+    assert Bet(2, 3) == Bet(2, 3)
+    assert not Bet(2, 3) < Bet(2, 3)
+    assert max([Bet(1, 6), Bet(3, 1), Bet(3, 2)]) == Bet(3, 2)
+
+
+def test_bet_is_immutable():
+    bet = Bet(2, 3)
+    with pytest.raises(FrozenInstanceError):
+        bet.amount = 5